@@ -0,0 +1,55 @@
+"""
+Standalone FastAPI entrypoint for external clients (e.g. institutional
+bulk-verification tools). Run it as its own process with one worker per
+core so verification is CPU-parallel:
+
+    uvicorn jacvs_api:app --host 127.0.0.1 --port 8000 --workers $(nproc)
+
+Each worker process owns its own persistent Tesseract API and caches via
+jacvs_core. Never start this inside the Streamlit process - app.py calls
+verify_bytes in-process and needs no HTTP hop.
+"""
+import hashlib
+
+from fastapi import FastAPI, HTTPException, UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from jacvs_core import verify_bytes
+
+app = FastAPI(title="JACVS Verifier API")
+
+async def _read_and_verify(file):
+    # The upload is already spooled by Starlette, so hash it with
+    # file_digest's zero-copy readinto loop (SHA-NI when the CPU has it)
+    # instead of materialising intermediate chunk copies. The hash hits
+    # the result cache before any decoding.
+    digest = await run_in_threadpool(hashlib.file_digest, file.file, 'sha256')
+    await file.seek(0)
+    contents = await file.read()
+    # Decode + OCR are CPU-bound; keep them off the event loop so other
+    # requests stay responsive. Tesseract releases the GIL while
+    # recognising, so a threadpool is enough here.
+    return await run_in_threadpool(verify_bytes, contents,
+                                   file.content_type, digest.hexdigest())
+
+@app.post("/verify")
+async def verify_certificate(file: UploadFile):
+    try:
+        return await _read_and_verify(file)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/verify_batch")
+async def verify_certificate_batch(files: list[UploadFile]):
+    # Bulk verification for institutions: one request amortizes the
+    # persistent Tesseract API across all documents, and the hash cache
+    # makes re-submitted documents near-free. One bad file does not fail
+    # the whole batch - its error is reported inline.
+    results = []
+    for file in files:
+        try:
+            result = await _read_and_verify(file)
+        except ValueError as e:
+            result = {"error": str(e)}
+        results.append({"filename": file.filename, **result})
+    return results
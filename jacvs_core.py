@@ -0,0 +1,175 @@
+import os
+
+# Tesseract's OpenMP parallelism is slower than single-threaded on typical
+# workloads; must be set before the Tesseract library is loaded.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+import hashlib
+import io
+import re
+import threading
+
+from PIL import Image, UnidentifiedImageError
+from pdf2image import convert_from_bytes
+from pdf2image.exceptions import PDFPageCountError, PDFSyntaxError
+from tesserocr import OEM, PSM, PyTessBaseAPI
+
+# One Tesseract API per process: loading the traineddata is the expensive part,
+# so initialise once at import and reuse it for every call. The lock keeps
+# concurrent callers from interleaving SetImage/GetUTF8Text on the shared API.
+_API = PyTessBaseAPI(lang='eng+hin', psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+_API_LOCK = threading.Lock()
+
+# Matches "Name: ...", "Roll No: ...", "Certificate ID: ..." (and common
+# variants) in a single compiled scan per line; anchored so a label buried
+# mid-line cannot clobber a field.
+_FIELD_RE = re.compile(r'^\s*(Name|Roll(?:\s*No\.?)?|Cert(?:ificate)?\s*ID)\s*[:\-]\s*(.+?)\s*$', re.I)
+_FIELD_KEY = {'name': 'name', 'roll': 'roll_no', 'cert': 'cert_id'}
+
+# Lookup data never changes at runtime, so build it once at import instead of
+# on every upload, with case-folded keys so OCR capitalisation drift
+# ("JOHN DOE" vs "John Doe") cannot cause a false "Forged" verdict. A real
+# deployment would load the registry here.
+_MOCK_DB = {k.strip().lower(): v for k, v in {
+    'John Doe': {'roll_no': 'RU12345', 'cert_id': 'RU/UG/2023/001'},
+}.items()}
+
+# Verification is deterministic in the uploaded bytes, so repeat uploads of
+# the same document can skip the OCR pipeline entirely. FIFO-capped.
+_RESULT_CACHE = {}
+_RESULT_CACHE_MAX = 1024
+_CACHE_LOCK = threading.Lock()
+
+# ---------------- OCR FUNCTION ----------------
+def process_certificate_ocr(image):
+    """
+    Extracts important fields like name, roll number, and certificate ID
+    from the given certificate image using Tesseract OCR.
+    """
+    try:
+        # Certificates are monochrome text: grayscale cuts the LSTM input
+        # bandwidth 3x, and accuracy plateaus around 300 DPI so anything
+        # beyond ~2000 px is pure cost
+        image = image.convert('L')
+        if max(image.size) > 2000:
+            image.thumbnail((2000, 2000), Image.LANCZOS)
+
+        # Run OCR on the shared in-process Tesseract API
+        with _API_LOCK:
+            _API.SetImage(image)
+            text = _API.GetUTF8Text()
+            word_confs = _API.AllWordConfidences()
+
+        # Real per-word confidences from the engine, not a mocked value
+        ocr_confidence = int(sum(word_confs) / len(word_confs)) if word_confs else 0
+
+        # Extract fields with one regex pass per line
+        extracted_data = {
+            "name": "",
+            "roll_no": "",
+            "cert_id": ""
+        }
+
+        for m in map(_FIELD_RE.match, text.split("\n")):
+            if m:
+                extracted_data[_FIELD_KEY[m.group(1)[:4].lower()]] = m.group(2)
+
+        return {
+            "extracted_data": extracted_data,
+            "ocr_confidence": ocr_confidence,
+            "full_text": text
+        }
+
+    except Exception as e:
+        return {
+            "extracted_data": {},
+            "ocr_confidence": 0,
+            "full_text": "",
+            "error": str(e)
+        }
+
+# ---------------- VERIFICATION PIPELINE ----------------
+def verify_bytes(contents, content_type, document_hash=None, image=None):
+    """
+    Runs the full verification pipeline (decode, OCR, registry lookup) on an
+    uploaded document and returns the report dict. Results are cached on the
+    SHA-256 of the original bytes, so re-uploads are near-free. Callers that
+    hashed the upload while receiving it can pass document_hash to skip the
+    second pass, and callers that already decoded the document (e.g. a PDF
+    page rendered for a preview) can pass it as image to skip the decode.
+    """
+    # Hash the original upload bytes - stable across Pillow versions and
+    # skips an expensive PNG re-encode
+    if document_hash is None:
+        document_hash = hashlib.sha256(contents).hexdigest()
+
+    # Same document re-uploaded? Serve the cached verdict.
+    with _CACHE_LOCK:
+        cached = _RESULT_CACHE.get(document_hash)
+    if cached is not None:
+        return cached
+
+    # Corrupt uploads are expected bad input here, so normalise decode
+    # failures to ValueError for callers to report inline.
+    if image is None:
+        if content_type == "application/pdf":
+            # If it's a PDF, rasterize only the first page - we never use the rest
+            try:
+                images = convert_from_bytes(contents, first_page=1, last_page=1,
+                                            dpi=200, fmt='jpeg', thread_count=1)
+            except (PDFPageCountError, PDFSyntaxError) as e:
+                raise ValueError("Could not read PDF - file may be corrupt.") from e
+            if not images:
+                raise ValueError("No pages found in PDF.")
+            image = images[0]
+        else:
+            try:
+                image = Image.open(io.BytesIO(contents))
+            except UnidentifiedImageError as e:
+                raise ValueError("Could not read image - file may be corrupt.") from e
+
+    ocr_result = process_certificate_ocr(image)
+
+    extracted_data = ocr_result.get('extracted_data', {})
+    name = extracted_data.get('name', '').strip()
+    roll_no = extracted_data.get('roll_no', '').strip()
+    cert_id = extracted_data.get('cert_id', '').strip()
+
+    anomalies = []
+    confidence_score = 85
+    status = "Valid"
+    recommendation = "Proceed with verification."
+
+    # Verification logic - one case-insensitive lookup
+    record = _MOCK_DB.get(name.lower())
+    if record is not None:
+        if record['roll_no'] != roll_no or record['cert_id'] != cert_id:
+            anomalies.append("Mismatch in Roll No or Certificate ID")
+            status = "Caution"
+            confidence_score = 60
+            recommendation = "Manual review recommended."
+    else:
+        anomalies.append("Name not found in records")
+        status = "Forged"
+        confidence_score = 30
+        recommendation = "Document appears invalid."
+
+    if ocr_result.get('ocr_confidence', 0) < 70:
+        anomalies.append("Low OCR confidence - blurry image?")
+
+    # Final result
+    result = {
+        "status": status,
+        "confidence_score": confidence_score,
+        "recommendation": recommendation,
+        "anomalies": anomalies,
+        "extracted_data": extracted_data,
+        "document_hash": document_hash,
+        "full_text": ocr_result.get('full_text', '')
+    }
+
+    with _CACHE_LOCK:
+        if len(_RESULT_CACHE) >= _RESULT_CACHE_MAX:
+            _RESULT_CACHE.pop(next(iter(_RESULT_CACHE)))
+        _RESULT_CACHE[document_hash] = result
+    return result